@@ -23,9 +23,10 @@ Throughout the code, there's a focus on handling different types of problems (fe
 In summary, this code provides a toolkit for solving different types of optimization problems using cutting plane methods. It's designed to be adaptable to various problem types and to efficiently search for solutions by iteratively refining the search space based on feedback from problem-specific oracles.
 """
 
-import copy
 from typing import Any, MutableSequence, Optional, Tuple, Union
 
+import numpy as np
+
 from .ell_config import CutStatus, Options
 from .ell_typing import (
     ArrayType,
@@ -113,14 +114,21 @@ def cutting_plane_feas(
         2. An integer representing the number of iterations performed.
     """
 
-    for niter in range(options.max_iters):
-        cut = omega.assess_feas(space.xc())  # query the oracle at space.xc()
+    # bind once, not per iteration
+    max_iters, tolerance = options.max_iters, options.tolerance
+    assess_feas = omega.assess_feas
+    space_xc, space_tsq = space.xc, space.tsq
+    update_bias_cut = space.update_bias_cut
+    success = CutStatus.Success
+    for niter in range(max_iters):
+        xc = space_xc()
+        cut = assess_feas(xc)  # query the oracle at space.xc()
         if cut is None:  # feasible solution obtained
-            return space.xc(), niter
-        status = space.update_bias_cut(cut)  # update space
-        if status != CutStatus.Success or space.tsq() < options.tolerance:
+            return xc, niter
+        status = update_bias_cut(cut)  # update space
+        if status is not success or space_tsq() < tolerance:
             return None, niter
-    return None, options.max_iters
+    return None, max_iters
 
 
 def cutting_plane_optim(
@@ -153,17 +161,25 @@ def cutting_plane_optim(
     :return: The function `cutting_plane_optim` returns a tuple containing the following elements:
     """
     x_best = None
-    for niter in range(options.max_iters):
-        cut, gamma1 = omega.assess_optim(space.xc(), gamma)
+    # bind once, not per iteration
+    max_iters, tolerance = options.max_iters, options.tolerance
+    assess_optim = omega.assess_optim
+    space_xc, space_tsq = space.xc, space.tsq
+    update_central_cut = space.update_central_cut
+    update_bias_cut = space.update_bias_cut
+    success = CutStatus.Success
+    for niter in range(max_iters):
+        xc = space_xc()
+        cut, gamma1 = assess_optim(xc, gamma)
         if gamma1 is not None:  # better gamma obtained
             gamma = gamma1
-            x_best = copy.copy(space.xc())
-            status = space.update_central_cut(cut)
+            x_best = xc.copy()
+            status = update_central_cut(cut)
         else:
-            status = space.update_bias_cut(cut)
-        if status != CutStatus.Success or space.tsq() < options.tolerance:
+            status = update_bias_cut(cut)
+        if status is not success or space_tsq() < tolerance:
             return x_best, gamma, niter
-    return x_best, gamma, options.max_iters
+    return x_best, gamma, max_iters
 
 
 # def cutting_plane_feas_q(
@@ -245,23 +261,31 @@ def cutting_plane_optim_q(
     """
     x_best = None
     retry = False
-    for niter in range(options.max_iters):
-        cut, x_q, gamma1, more_alt = omega.assess_optim_q(space_q.xc(), gamma, retry)
+    # bind once, not per iteration
+    max_iters, tolerance = options.max_iters, options.tolerance
+    assess_optim_q = omega.assess_optim_q
+    space_xc, space_tsq = space_q.xc, space_q.tsq
+    update_q = space_q.update_q
+    success = CutStatus.Success
+    no_soln = CutStatus.NoSoln
+    no_effect = CutStatus.NoEffect
+    for niter in range(max_iters):
+        cut, x_q, gamma1, more_alt = assess_optim_q(space_xc(), gamma, retry)
         if gamma1 is not None:  # better gamma obtained
             gamma = gamma1
             x_best = x_q
-        status = space_q.update_q(cut)
-        if status == CutStatus.Success:
+        status = update_q(cut)
+        if status is success:
             retry = False
-        elif status == CutStatus.NoSoln:
+        elif status is no_soln:
             return x_best, gamma, niter
-        elif status == CutStatus.NoEffect:
+        elif status is no_effect:
             if not more_alt:  # no more alternative cut
                 return x_best, gamma, niter
             retry = True
-        if space_q.tsq() < options.tolerance:
+        if space_tsq() < tolerance:
             return x_best, gamma, niter
-    return x_best, gamma, options.max_iters
+    return x_best, gamma, max_iters
 
 
 def bsearch(
@@ -290,9 +314,14 @@ def bsearch(
     # Assume monotonicity of the objective function
     lower, upper = intrvl
     T = type(upper)  # T could be `int`
+    is_float = issubclass(T, (float, np.floating))  # including np.float64/np.float32
+    tolerance = options.tolerance
     for niter in range(options.max_iters):
-        tau = (upper - lower) / 2
-        if tau < options.tolerance:
+        if is_float:  # no overflow for huge intervals
+            tau = upper * 0.5 - lower * 0.5
+        else:  # ints cannot overflow; note that "/ 2" still yields a float
+            tau = (upper - lower) / 2
+        if tau < tolerance:
             return upper, niter
         gamma = T(lower + tau)
         if omega.assess_bs(gamma):  # feasible solution obtained
@@ -341,7 +370,7 @@ class BSearchAdaptor(OracleBS):
         :type gamma: Num
         :return: The function assess_bs returns a boolean value.
         """
-        space = copy.deepcopy(self.space)
+        space = self.space.clone()
         self.omega.update(gamma)
         x_feas, _ = cutting_plane_feas(self.omega, space, self.options)
         if x_feas is not None:
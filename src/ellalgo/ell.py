@@ -18,7 +18,7 @@ The class also includes some helper methods like xc() and tsq() that allow acces
 Overall, this code provides a flexible and efficient way to represent and manipulate an ellipsoidal search space, which is a crucial component in certain types of optimization algorithms. The class encapsulates the complex mathematics involved in these operations, providing a clean interface for users of the class to work with ellipsoids in their algorithms.
 """
 
-from typing import Callable, Tuple, Union
+from typing import Callable, Optional, Tuple, Union, cast
 
 import numpy as np
 
@@ -33,15 +33,41 @@ Cut = Tuple[ArrayType, CutChoice]
 
 # The `Ell` class represents an ellipsoidal search space.
 class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
-    no_defer_trick: bool = False
+    # "__dict__" lets an instance override the class default of no_defer_trick
+    __slots__ = (
+        "__dict__",
+        "_mq",
+        "_xc",
+        "_kappa",
+        "_tsq",
+        "_grad",
+        "_grad_t",
+        "helper",
+        "_bias_cut_strategy",
+        "_central_cut_strategy",
+        "_q_strategy",
+    )
 
+    no_defer_trick: bool = False
     _mq: Mat
     _xc: ArrayType
     _kappa: float
     _tsq: float
+    _grad: np.ndarray  # scratch for g in the working dtype
+    _grad_t: np.ndarray  # scratch for Q*g
     helper: EllCalc
-
-    def __init__(self, val, xc: ArrayType) -> None:
+    _bias_cut_strategy: Callable
+    _central_cut_strategy: Callable
+    _q_strategy: Callable
+
+    def __init__(
+        self,
+        val,
+        xc: ArrayType,
+        dtype=np.float64,
+        *,
+        no_defer_trick: Optional[bool] = None,
+    ) -> None:
         """
         The function initializes an object with given values and attributes.
 
@@ -54,17 +80,39 @@ class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
             calculated using `len(xc)` and stored in the variable
 
         :type xc: ArrayType
+
+        :param dtype: The floating-point type of `xc` and `mq`. `np.float32` halves the memory
+            traffic of the O(n^2) update at the cost of precision, defaults to `np.float64`
+
+        :param no_defer_trick: If true, kappa is folded into `mq` after every update instead of being
+            kept as a separate scale factor. This adds a full O(n^2) pass over `mq` per update, so
+            leave it off unless the explicit matrix is needed, defaults to the class attribute `no_defer_trick` (False)
+
+        :type no_defer_trick: Optional[bool]
+
+        Examples:
+            >>> ell = Ell(1.0, np.zeros(4), dtype=np.float32)
+            >>> ell._mq.dtype
+            dtype('float32')
         """
         ndim = len(xc)
+        if no_defer_trick is not None:
+            self.no_defer_trick = no_defer_trick
         self.helper = EllCalc(ndim)
-        self._xc = xc
+        # bind the cut strategies once instead of on every update
+        self._bias_cut_strategy = self.helper.calc_single_or_parallel
+        self._central_cut_strategy = self.helper.calc_single_or_parallel_central_cut
+        self._q_strategy = self.helper.calc_single_or_parallel_q
+        self._xc = cast(ArrayType, np.asarray(xc, dtype=dtype))
         self._tsq = 0.0
         if isinstance(val, (int, float)):
             self._kappa = val
-            self._mq = np.eye(ndim)
+            self._mq = np.eye(ndim, dtype=dtype)
         else:
             self._kappa = 1.0
-            self._mq = np.diag(val)
+            self._mq = np.diag(np.asarray(val, dtype=dtype))
+        self._grad = np.empty(ndim, dtype=dtype)
+        self._grad_t = np.empty(ndim, dtype=dtype)
 
     def xc(self) -> ArrayType:
         """
@@ -80,7 +128,37 @@ class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
         :param x: The parameter `x` is of type `ArrayType`
         :type x: ArrayType
         """
-        self._xc = xc
+        self._xc = cast(ArrayType, np.asarray(xc, dtype=self._xc.dtype))
+
+    def clone(self) -> "Ell":
+        """
+        The function `clone` returns an independent copy of the ellipsoid. `_mq` and `_xc` are
+        copied, the scalars are copied by value, and the clone gets its own helper (with the same
+        settings) and scratch buffers.
+
+        :return: a new `Ell` object with the same state.
+
+        Examples:
+            >>> ell = Ell(1.0, np.zeros(4))
+            >>> ell2 = ell.clone()
+            >>> status = ell2.update_central_cut((np.ones(4), 0.0))
+            >>> ell._xc
+            array([0., 0., 0., 0.])
+        """
+        ell = self.__class__.__new__(self.__class__)
+        ell.__dict__.update(self.__dict__)  # instance overrides such as no_defer_trick
+        ell._mq = self._mq.copy(order="K")
+        ell._xc = self._xc.copy()
+        ell._kappa = self._kappa
+        ell._tsq = self._tsq
+        ell._grad = np.empty_like(self._grad)
+        ell._grad_t = np.empty_like(self._grad_t)
+        ell.helper = EllCalc(len(self._xc))
+        ell.helper.__dict__.update(self.helper.__dict__)  # e.g. use_parallel_cut
+        ell._bias_cut_strategy = ell.helper.calc_single_or_parallel
+        ell._central_cut_strategy = ell.helper.calc_single_or_parallel_central_cut
+        ell._q_strategy = ell.helper.calc_single_or_parallel_q
+        return ell
 
     def tsq(self) -> float:
         """
@@ -104,7 +182,7 @@ class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
             >>> print(status)
             CutStatus.Success
         """
-        return self._update_core(cut, self.helper.calc_single_or_parallel)
+        return self._update_core(cut, self._bias_cut_strategy)
 
     def update_central_cut(self, cut) -> CutStatus:
         """
@@ -121,7 +199,7 @@ class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
             >>> print(status)
             CutStatus.Success
         """
-        return self._update_core(cut, self.helper.calc_single_or_parallel_central_cut)
+        return self._update_core(cut, self._central_cut_strategy)
 
     def update_q(self, cut) -> CutStatus:
         """
@@ -138,7 +216,7 @@ class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
             >>> print(status)
             CutStatus.Success
         """
-        return self._update_core(cut, self.helper.calc_single_or_parallel_q)
+        return self._update_core(cut, self._q_strategy)
 
     # private:
 
@@ -170,8 +248,10 @@ class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
             >>> print(status)
             CutStatus.Success
         """
-        grad, beta = cut
-        grad_t = self._mq @ grad  # n^2 multiplications
+        g, beta = cut
+        grad = self._grad
+        np.copyto(grad, g)  # in the working dtype, so a float64 g does not upcast mq
+        grad_t = np.matmul(self._mq, grad, out=self._grad_t)  # n^2 multiplications
         omega = grad.dot(grad_t)  # n multiplications
         self._tsq = self._kappa * omega
 
@@ -182,8 +262,11 @@ class Ell(SearchSpace2[ArrayType], SearchSpaceQ[ArrayType]):
 
         rho, sigma, delta = result
 
-        self._xc -= (rho / omega) * grad_t
-        self._mq -= (sigma / omega) * np.outer(grad_t, grad_t)
+        mq_t = np.outer(grad_t, grad_t)  # temporary, so Ell keeps only one n x n matrix
+        mq_t *= sigma / omega
+        self._mq -= mq_t
+        grad_t *= rho / omega  # grad_t is not needed any more
+        np.subtract(self._xc, grad_t, out=self._xc)
         self._kappa *= delta
 
         if self.no_defer_trick:
@@ -28,6 +28,11 @@ from typing import Optional, Tuple
 from .ell_calc_core import EllCalcCore
 from .ell_config import CutStatus
 
+# Enum member access goes through a descriptor; bind the hot ones once.
+_SUCCESS = CutStatus.Success
+_NO_SOLN = CutStatus.NoSoln
+_NO_EFFECT = CutStatus.NoEffect
+
 
 class EllCalc:
     """The `EllCalc` class is used for calculating ellipsoid parameters and has attributes
@@ -38,6 +43,9 @@ class EllCalc:
         >>> calc = EllCalc(3)
     """
 
+    # "__dict__" lets an instance override the class default of use_parallel_cut
+    __slots__ = ("__dict__", "_n_f", "helper")
+
     use_parallel_cut: bool = True
     _n_f: float
     helper: EllCalcCore
@@ -115,8 +123,8 @@ class EllCalc:
             (<CutStatus.Success: 0>, (0.01897790039191521, 0.3450527343984584, 1.0549907942519101))
         """
         if isinstance(beta, (int, float)) or len(beta) < 2 or not self.use_parallel_cut:
-            return (CutStatus.Success, self.helper.calc_central_cut(sqrt(tsq)))
-        return (CutStatus.Success, self.helper.calc_parallel_central_cut(beta[1], tsq))
+            return (_SUCCESS, self.helper.calc_central_cut(sqrt(tsq)))
+        return (_SUCCESS, self.helper.calc_parallel_central_cut(beta[1], tsq))
 
     def calc_parallel(
         self, beta0: float, beta1: float, tsq: float
@@ -134,12 +142,14 @@ class EllCalc:
         :return: The function `calc_parallel` returns a tuple of type `Tuple[CutStatus, Optional[Tuple[float, float, float]]]`.
         """
         if beta1 < beta0:
-            return (CutStatus.NoSoln, None)  # no sol'n
+            return (_NO_SOLN, None)  # no sol'n
         b1sq = beta1 * beta1
         if beta1 > 0.0 and tsq <= b1sq:
             return self.calc_bias_cut(beta0, tsq)
+        if beta0 == 0.0:  # cheaper special case
+            return (_SUCCESS, self.helper.calc_parallel_central_cut(beta1, tsq))
         return (
-            CutStatus.Success,
+            _SUCCESS,
             self.helper.calc_parallel_bias_cut(beta0, beta1, tsq),
         )
 
@@ -169,10 +179,10 @@ class EllCalc:
         assert beta >= 0.0
         bsq = beta * beta
         if tsq < bsq:
-            return (CutStatus.NoSoln, None)  # no sol'n
+            return (_NO_SOLN, None)  # no sol'n
         tau = sqrt(tsq)
         return (
-            CutStatus.Success,
+            _SUCCESS,
             self.helper.calc_bias_cut(beta, tau),
         )
 
@@ -211,16 +221,16 @@ class EllCalc:
         :return: The function `calc_parallel_q` returns a tuple of type `Tuple[CutStatus, float, float, float]`.
         """
         if beta1 < beta0:
-            return (CutStatus.NoSoln, None)  # no sol'n
+            return (_NO_SOLN, None)  # no sol'n
         b1sq = beta1 * beta1
         if beta1 > 0.0 and tsq <= b1sq:
             return self.calc_bias_cut_q(beta0, tsq)
         b0b1 = beta0 * beta1
         eta = tsq + self._n_f * b0b1
         if eta <= 0.0:  # for discrete optimization
-            return (CutStatus.NoEffect, None)  # no effect
+            return (_NO_EFFECT, None)  # no effect
         return (
-            CutStatus.Success,
+            _SUCCESS,
             self.helper.calc_parallel_bias_cut_fast(beta0, beta1, tsq, b0b1, eta),
         )
 
@@ -250,12 +260,12 @@ class EllCalc:
         """
         tau = sqrt(tsq)
         if tau < beta:
-            return (CutStatus.NoSoln, None)  # no sol'n
+            return (_NO_SOLN, None)  # no sol'n
         eta = tau + self._n_f * beta
         if eta <= 0.0:
-            return (CutStatus.NoEffect, None)
+            return (_NO_EFFECT, None)
         return (
-            CutStatus.Success,
+            _SUCCESS,
             self.helper.calc_bias_cut_fast(beta, tau, eta),
         )
 
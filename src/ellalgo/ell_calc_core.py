@@ -35,9 +35,23 @@ class EllCalcCore:
         >>> calc = EllCalcCore(3)
     """
 
+    __slots__ = (
+        "_n_f",
+        "_half_n",
+        "_n_plus_1",
+        "_inv_n",
+        "_n_sq",
+        "_cst0",
+        "_cst1",
+        "_cst2",
+        "_cst3",
+    )
+
     _n_f: float
     _half_n: float
     _n_plus_1: float
+    _inv_n: float
+    _n_sq: float
     _cst0: float
     _cst1: float
     _cst2: float
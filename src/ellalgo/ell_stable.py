@@ -1,4 +1,4 @@
-from typing import Callable, Tuple, Union
+from typing import Callable, Optional, Tuple, Union, cast
 
 import numpy as np
 
@@ -13,16 +13,47 @@ Cut = Tuple[ArrayType, CutChoice]
 
 # The `EllStable` class represents an ellipsoidal search space with stability properties.
 class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
-    no_defer_trick: bool = False
+    # "__dict__" lets an instance override the class default of no_defer_trick
+    __slots__ = (
+        "__dict__",
+        "_mq",
+        "_xc",
+        "_kappa",
+        "_tsq",
+        "_ndim",
+        "_inv_lower_g",
+        "_inv_diag_inv_lower_g",
+        "_g_t",
+        "_v",
+        "helper",
+        "_bias_cut_strategy",
+        "_central_cut_strategy",
+        "_q_strategy",
+    )
 
+    no_defer_trick: bool = False
     _mq: Matrix
     _xc: ArrayType
     _kappa: float
     _tsq: float
     _ndim: int
+    _inv_lower_g: np.ndarray  # scratch for inv(L)*g
+    _inv_diag_inv_lower_g: np.ndarray  # scratch for inv(D)*inv(L)*g
+    _g_t: np.ndarray  # scratch for Q*g
+    _v: np.ndarray  # scratch for the rank-one update
     helper: EllCalc
-
-    def __init__(self, val, xc: ArrayType) -> None:
+    _bias_cut_strategy: Callable
+    _central_cut_strategy: Callable
+    _q_strategy: Callable
+
+    def __init__(
+        self,
+        val,
+        xc: ArrayType,
+        dtype=np.float64,
+        *,
+        no_defer_trick: Optional[bool] = None,
+    ) -> None:
         """
         The function initializes an object with given values and attributes.
 
@@ -35,18 +66,44 @@ class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
         calculated using `len(xc)` and stored in the variable
 
         :type xc: ArrayType
+
+        :param dtype: The floating-point type of `xc`, `mq` and the work vectors. `np.float32` halves
+        the memory traffic of the O(n^2) sweeps at the cost of precision, defaults to `np.float64`
+
+        :param no_defer_trick: If true, kappa is folded into the diagonal of the LDL' factor after
+        every update instead of being kept as a separate scale factor. This costs an extra O(n) pass
+        per update, defaults to the class attribute `no_defer_trick` (False)
+
+        :type no_defer_trick: Optional[bool]
+
+        Examples:
+            >>> ell = EllStable(1.0, np.zeros(4), dtype=np.float32)
+            >>> ell._mq.dtype
+            dtype('float32')
         """
         ndim = len(xc)
+        if no_defer_trick is not None:
+            self.no_defer_trick = no_defer_trick
         self.helper = EllCalc(ndim)
-        self._xc = xc
+        # bind the cut strategies once instead of on every update
+        self._bias_cut_strategy = self.helper.calc_single_or_parallel
+        self._central_cut_strategy = self.helper.calc_single_or_parallel_central_cut
+        self._q_strategy = self.helper.calc_single_or_parallel_q
+        self._xc = cast(ArrayType, np.asarray(xc, dtype=dtype))
         self._tsq = 0.0
         self._ndim = ndim
+        # Fortran order keeps the columns of L contiguous
         if isinstance(val, (int, float)):
             self._kappa = val
-            self._mq = np.eye(ndim)
+            self._mq = np.eye(ndim, dtype=dtype, order="F")
         else:
             self._kappa = 1.0
-            self._mq = np.diag(val)
+            self._mq = np.zeros((ndim, ndim), dtype=dtype, order="F")
+            np.fill_diagonal(self._mq, val)
+        self._inv_lower_g = np.empty(ndim, dtype=dtype)
+        self._inv_diag_inv_lower_g = np.empty(ndim, dtype=dtype)
+        self._g_t = np.empty(ndim, dtype=dtype)
+        self._v = np.empty(ndim, dtype=dtype)
 
     def xc(self) -> ArrayType:
         """
@@ -62,7 +119,40 @@ class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
         :param x: The parameter `x` is of type `ArrayType`
         :type x: ArrayType
         """
-        self._xc = x
+        self._xc = cast(ArrayType, np.asarray(x, dtype=self._xc.dtype))
+
+    def clone(self) -> "EllStable":
+        """
+        The function `clone` returns an independent copy of the ellipsoid. `_mq` and `_xc` are
+        copied, the scalars are copied by value, and the clone gets its own helper (with the same
+        settings) and scratch buffers.
+
+        :return: a new `EllStable` object with the same state.
+
+        Examples:
+            >>> ell = EllStable(1.0, np.zeros(4))
+            >>> ell2 = ell.clone()
+            >>> status = ell2.update_central_cut((np.ones(4), 0.0))
+            >>> ell._xc
+            array([0., 0., 0., 0.])
+        """
+        ell = self.__class__.__new__(self.__class__)
+        ell.__dict__.update(self.__dict__)  # instance overrides such as no_defer_trick
+        ell._mq = self._mq.copy(order="K")
+        ell._xc = self._xc.copy()
+        ell._kappa = self._kappa
+        ell._tsq = self._tsq
+        ell._ndim = self._ndim
+        ell._inv_lower_g = np.empty_like(self._inv_lower_g)
+        ell._inv_diag_inv_lower_g = np.empty_like(self._inv_diag_inv_lower_g)
+        ell._g_t = np.empty_like(self._g_t)
+        ell._v = np.empty_like(self._v)
+        ell.helper = EllCalc(self._ndim)
+        ell.helper.__dict__.update(self.helper.__dict__)  # e.g. use_parallel_cut
+        ell._bias_cut_strategy = ell.helper.calc_single_or_parallel
+        ell._central_cut_strategy = ell.helper.calc_single_or_parallel_central_cut
+        ell._q_strategy = ell.helper.calc_single_or_parallel_q
+        return ell
 
     def tsq(self) -> float:
         """
@@ -86,7 +176,7 @@ class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
             >>> print(status)
             CutStatus.Success
         """
-        return self._update_core(cut, self.helper.calc_single_or_parallel)
+        return self._update_core(cut, self._bias_cut_strategy)
 
     def update_central_cut(self, cut) -> CutStatus:
         """
@@ -103,7 +193,7 @@ class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
             >>> print(status)
             CutStatus.Success
         """
-        return self._update_core(cut, self.helper.calc_single_or_parallel_central_cut)
+        return self._update_core(cut, self._central_cut_strategy)
 
     def update_q(self, cut) -> CutStatus:
         """
@@ -121,7 +211,7 @@ class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
             >>> print(status)
             CutStatus.Success
         """
-        return self._update_core(cut, self.helper.calc_single_or_parallel_q)
+        return self._update_core(cut, self._q_strategy)
 
     # private:
 
@@ -157,25 +247,23 @@ class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
             CutStatus.Success
         """
         g, beta = cut
+        mq, ndim = self._mq, self._ndim  # avoid attribute lookups in the loops
 
         # calculate inv(L)*g: (n-1)*n/2 multiplications
-        inv_lower_g = g.copy()  # initially
+        inv_lower_g = self._inv_lower_g
+        np.copyto(inv_lower_g, g)  # initially
 
-        for j in range(self._ndim - 1):
-            for i in range(j + 1, self._ndim):
-                self._mq[j, i] = self._mq[i, j] * inv_lower_g[j]
-                # keep for rank-one update
-                inv_lower_g[i] -= self._mq[j, i]
+        for j in range(ndim - 1):
+            inv_lower_g[j + 1 :] -= mq[j + 1 :, j] * inv_lower_g[j]
 
         # calculate inv(D)*inv(L)*g: n
-        inv_diag_inv_lower_g = inv_lower_g.copy()  # initially
-        for i in range(self._ndim):
-            inv_diag_inv_lower_g[i] *= self._mq[i, i]
+        inv_diag_inv_lower_g = np.multiply(
+            inv_lower_g, mq.diagonal(), out=self._inv_diag_inv_lower_g
+        )
 
         # print(inv_diag_inv_lower_g)
         # calculate omega: n
-        gg_t = inv_lower_g * inv_diag_inv_lower_g
-        omega = sum(gg_t)
+        omega = float(inv_lower_g @ inv_diag_inv_lower_g)
 
         self._tsq = self._kappa * omega  # need for helper
 
@@ -187,34 +275,36 @@ class EllStable(SearchSpace[ArrayType], SearchSpaceQ[ArrayType]):
         rho, sigma, delta = result
 
         # calculate Q*g = inv(L')*inv(D)*inv(L)*g : (n-1)*n/2
-        g_t = inv_diag_inv_lower_g.copy()  # initially
-        for i in range(self._ndim - 1, 0, -1):
-            for j in range(i, self._ndim):
-                g_t[i - 1] -= self._mq[j, i - 1] * g_t[j]  # TODO
+        g_t = self._g_t
+        np.copyto(g_t, inv_diag_inv_lower_g)  # initially
+        for i in range(ndim - 1, 0, -1):
+            g_t[i - 1] -= mq[i:, i - 1] @ g_t[i:]
 
         # print(g_t)
         # calculate xc: n
-        self._xc -= (rho / omega) * g_t
+        g_t *= rho / omega  # g_t is not needed any more
+        self._xc -= g_t
 
         # rank-one update: 3*n + (n-1)*n/2
         # r = self._sigma / omega
         mu = sigma / (1.0 - sigma)
         oldt = omega / mu  # initially
-        v = g.copy()
-        for j in range(self._ndim):
+        v = self._v
+        np.copyto(v, g)
+        for j in range(ndim):
             p = v[j]
             temp = inv_diag_inv_lower_g[j]
             newt = oldt + p * temp
             beta2 = temp / newt
-            self._mq[j, j] *= oldt / newt  # update invD
-            for k in range(j + 1, self._ndim):
-                v[k] -= self._mq[j, k]
-                self._mq[k, j] += beta2 * v[k]
+            mq[j, j] *= oldt / newt  # update invD
+            # column j of L is still the old one here
+            v[j + 1 :] -= mq[j + 1 :, j] * inv_lower_g[j]
+            mq[j + 1 :, j] += beta2 * v[j + 1 :]
             oldt = newt
 
         self._kappa *= delta
 
-        if self.no_defer_trick:
-            self._mq *= self._kappa
+        if self.no_defer_trick:  # Q = L*D*L', so only D takes kappa
+            mq[np.diag_indices(ndim)] *= self._kappa
             self._kappa = 1.0
         return status
@@ -1,3 +1,4 @@
+import copy
 from abc import ABC, abstractmethod
 from typing import Generic, MutableSequence, Optional, Tuple, TypeVar, Union
 
@@ -112,6 +113,8 @@ class OracleBS(ABC):
 # The `SearchSpace` class is an abstract base class that defines methods for updating deep-cut and
 # central cut, as well as accessing the xc and tsq attributes.
 class SearchSpace(Generic[ArrayType]):
+    __slots__ = ()
+
     @abstractmethod
     def update_bias_cut(self, cut: Cut) -> CutStatus:
         """
@@ -152,6 +155,8 @@ class SearchSpace(Generic[ArrayType]):
 
 
 class SearchSpaceQ(Generic[ArrayType]):
+    __slots__ = ()
+
     @abstractmethod
     def update_q(self, cut: Cut) -> CutStatus:
         """
@@ -178,6 +183,8 @@ class SearchSpaceQ(Generic[ArrayType]):
 
 
 class SearchSpace2(SearchSpace[ArrayType]):
+    __slots__ = ()
+
     @abstractmethod
     def set_xc(self, xc: ArrayType) -> None:
         """
@@ -186,3 +193,13 @@ class SearchSpace2(SearchSpace[ArrayType]):
         :param x: The parameter `x` is of type `ArrayType`
         :type x: ArrayType
         """
+
+    def clone(self) -> "SearchSpace2[ArrayType]":
+        """
+        The function `clone` returns an independent copy of the search space, so that it can be
+        updated without affecting the original one. The default makes a deep copy; subclasses may
+        override it with something cheaper.
+
+        :return: a new search space object of the same type.
+        """
+        return copy.deepcopy(self)
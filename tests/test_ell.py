@@ -76,3 +76,76 @@ def test_update_q_no_effect():
     assert ell._xc == approx(np.zeros(4))
     assert ell._mq == approx(np.eye(4))
     assert ell._kappa == approx(0.01)
+
+
+def test_clone():
+    ell = Ell(0.01, np.zeros(4))
+    ell2 = ell.clone()
+    cut = 0.5 * np.ones(4), 0.0
+    status = ell2.update_central_cut(cut)
+    assert status == CutStatus.Success
+    assert ell2._xc == approx(-0.01 * np.ones(4))
+    assert ell._xc == approx(np.zeros(4))
+    assert ell._mq == approx(np.eye(4))
+    assert ell._kappa == 0.01
+
+
+def test_clone_independent_helper():
+    ell = Ell(0.01, np.zeros(4))
+    ell.helper.use_parallel_cut = False
+    ell2 = ell.clone()
+    assert ell2.helper.use_parallel_cut is False
+    ell2.helper.use_parallel_cut = True
+    assert ell.helper.use_parallel_cut is False
+    assert ell2._grad_t is not ell._grad_t
+
+
+def test_float32():
+    ell = Ell(0.01, np.zeros(4), dtype=np.float32)
+    cut = 0.5 * np.ones(4), 0.0
+    status = ell.update_central_cut(cut)
+    assert status == CutStatus.Success
+    assert ell._mq.dtype == np.float32
+    assert ell._xc.dtype == np.float32
+    assert ell._xc == approx(-0.01 * np.ones(4))
+    assert ell._mq == approx(np.eye(4) - 0.1 * np.ones((4, 4)))
+    assert ell._kappa == approx(0.16 / 15.0)
+
+
+def test_no_defer_trick():
+    ell = Ell(0.01, np.zeros(4))
+    ell2 = Ell(0.01, np.zeros(4), no_defer_trick=True)
+    cut = 0.5 * np.ones(4), 0.0
+    assert ell.update_central_cut(cut) == CutStatus.Success
+    assert ell2.update_central_cut(cut) == CutStatus.Success
+    assert ell2._kappa == 1.0
+    assert ell2._mq == approx(ell._kappa * ell._mq)
+    assert ell2._xc == approx(ell._xc)
+
+
+def test_float32_set_xc():
+    ell = Ell(0.01, np.zeros(4), dtype=np.float32)
+    ell.set_xc(np.ones(4))
+    assert ell._xc.dtype == np.float32
+    status = ell.update_central_cut((0.5 * np.ones(4), 0.0))
+    assert status == CutStatus.Success
+    assert ell._xc.dtype == np.float32
+    assert ell._xc == approx(0.99 * np.ones(4))
+
+
+def test_no_defer_trick_instance():
+    ell = Ell(0.01, np.zeros(4))
+    ell.no_defer_trick = True
+    assert ell.no_defer_trick is True
+    assert ell.clone().no_defer_trick is True
+    assert Ell.no_defer_trick is False
+    assert Ell(0.01, np.zeros(4)).no_defer_trick is False
+
+
+def test_no_defer_trick_class_default():
+    Ell.no_defer_trick = True
+    try:
+        assert Ell(0.01, np.zeros(4)).no_defer_trick is True
+        assert Ell(0.01, np.zeros(4), no_defer_trick=False).no_defer_trick is False
+    finally:
+        Ell.no_defer_trick = False
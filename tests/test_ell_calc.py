@@ -10,6 +10,20 @@ def test_construct():
     assert ell_calc._n_f == 4.0
 
 
+def test_use_parallel_cut():
+    ell_calc = EllCalc(4)
+    ell_calc.use_parallel_cut = False
+    assert EllCalc.use_parallel_cut is True
+    assert EllCalc(4).use_parallel_cut is True
+    _, (_, sigma, _) = ell_calc.calc_single_or_parallel_central_cut([0, 0.05], 0.01)
+    assert sigma == approx(0.4)
+    EllCalc.use_parallel_cut = False
+    try:
+        assert EllCalc(4).use_parallel_cut is False
+    finally:
+        EllCalc.use_parallel_cut = True
+
+
 def test_calc_central_cut():
     ell_calc = EllCalc(4)
     status, result = ell_calc.calc_single_or_parallel_central_cut([0, 0.05], 0.01)
@@ -50,6 +64,35 @@ def test_calc_parallel_central_cut():
     assert delta == approx(1.2)
 
 
+def test_calc_parallel_beta0_zero():
+    ell_calc = EllCalc(4)
+    # beta0 == 0 takes the parallel central-cut path; it agrees with the general formula
+    for beta1 in (0.01, 0.05, 0.09):
+        status, result = ell_calc.calc_parallel(0.0, beta1, 0.01)
+        assert status == CutStatus.Success
+        assert result == approx(
+            ell_calc.helper.calc_parallel_bias_cut(0.0, beta1, 0.01)
+        )
+
+    # tiny beta1: the central-cut formula gives the correct limit
+    status, result = ell_calc.calc_parallel(0.0, 1e-9, 0.01)
+    assert status == CutStatus.Success
+    assert result is not None
+    rho, sigma, delta = result
+    assert rho == approx(5e-10)
+    assert sigma == approx(1.0)
+    assert delta == approx(4.0 / 3.0)
+
+    # degenerate slab (beta0 == beta1 == 0): flatten onto the hyperplane
+    status, result = ell_calc.calc_parallel(0.0, 0.0, 0.01)
+    assert status == CutStatus.Success
+    assert result is not None
+    rho, sigma, delta = result
+    assert rho == 0.0
+    assert sigma == approx(1.0)
+    assert delta == approx(4.0 / 3.0)
+
+
 def test_calc_parallel():
     ell_calc = EllCalc(4)
     status, result = ell_calc.calc_parallel(0.07, 0.03, 0.01)
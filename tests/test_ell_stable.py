@@ -61,3 +61,79 @@ def test_update_parallel_no_effect():
     assert status == CutStatus.NoEffect
     assert ell._xc == approx(np.zeros(4))
     assert ell._kappa == approx(0.01)
+
+
+def test_clone():
+    ell = EllStable(0.01, np.zeros(4))
+    ell2 = ell.clone()
+    cut = 0.5 * np.ones(4), 0.0
+    status = ell2.update_central_cut(cut)
+    assert status == CutStatus.Success
+    assert ell2._xc == approx(-0.01 * np.ones(4))
+    assert ell._xc == approx(np.zeros(4))
+    assert ell._mq == approx(np.eye(4))
+    assert ell._kappa == 0.01
+
+
+def test_clone_independent_helper():
+    ell = EllStable(0.01, np.zeros(4))
+    ell.helper.use_parallel_cut = False
+    ell2 = ell.clone()
+    assert ell2.helper.use_parallel_cut is False
+    ell2.helper.use_parallel_cut = True
+    assert ell.helper.use_parallel_cut is False
+    assert ell2._g_t is not ell._g_t
+    assert ell2._v is not ell._v
+
+
+def test_no_defer_trick():
+    ell = EllStable(10.0, np.zeros(3))
+    ell2 = EllStable(10.0, np.zeros(3), no_defer_trick=True)
+    for grad in ([1.0, 0.5, -0.2], [-0.3, 1.0, 0.4], [0.2, -0.7, 1.0]):
+        cut = np.array(grad), 0.1
+        assert ell.update_bias_cut(cut) == CutStatus.Success
+        assert ell2.update_bias_cut(cut) == CutStatus.Success
+    assert ell2._kappa == 1.0
+    assert ell2._xc == approx(ell._xc)
+    assert ell2._tsq == approx(ell._tsq)
+
+
+def test_float32():
+    ell = EllStable(0.01, np.zeros(4), dtype=np.float32)
+    cut = 0.5 * np.ones(4), 0.0
+    status = ell.update_central_cut(cut)
+    assert status == CutStatus.Success
+    assert ell._mq.dtype == np.float32
+    assert ell._xc.dtype == np.float32
+    assert ell._xc == approx(-0.01 * np.ones(4))
+    assert ell._kappa == approx(0.16 / 15.0)
+
+
+def test_no_defer_trick_instance():
+    ell = EllStable(0.01, np.zeros(4))
+    ell.no_defer_trick = True
+    assert ell.no_defer_trick is True
+    assert ell.clone().no_defer_trick is True
+    assert EllStable.no_defer_trick is False
+    assert EllStable(0.01, np.zeros(4)).no_defer_trick is False
+
+
+def test_no_defer_trick_class_default():
+    EllStable.no_defer_trick = True
+    try:
+        assert EllStable(0.01, np.zeros(4)).no_defer_trick is True
+        assert (
+            EllStable(0.01, np.zeros(4), no_defer_trick=False).no_defer_trick is False
+        )
+    finally:
+        EllStable.no_defer_trick = False
+
+
+def test_float32_set_xc():
+    ell = EllStable(0.01, np.zeros(4), dtype=np.float32)
+    ell.set_xc(np.ones(4))
+    assert ell._xc.dtype == np.float32
+    status = ell.update_central_cut((0.5 * np.ones(4), 0.0))
+    assert status == CutStatus.Success
+    assert ell._xc.dtype == np.float32
+    assert ell._xc == approx(0.99 * np.ones(4))
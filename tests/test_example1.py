@@ -11,6 +11,11 @@ from ellalgo.ell_typing import OracleOptim
 
 num_constraints = 3
 
+# constant gradients, shared by every call (the ellipsoid does not modify them)
+grad_c0 = np.array([1.0, 1.0])
+grad_c1 = np.array([-1.0, 1.0])
+grad_obj = np.array([-1.0, -1.0])
+
 
 class MyOracle1(OracleOptim):
     """
@@ -45,17 +50,17 @@ class MyOracle1(OracleOptim):
 
             if self.idx == 0:
                 if (fj := f0 - 3.0) > 0.0:
-                    return ((np.array([1.0, 1.0]), fj), None)
+                    return ((grad_c0, fj), None)
             elif self.idx == 1:
                 if (fj := -x + y + 1.0) > 0.0:
-                    return ((np.array([-1.0, 1.0]), fj), None)
+                    return ((grad_c1, fj), None)
             elif self.idx == 2:
                 if (fj := gamma - f0) > 0.0:
-                    return ((np.array([-1.0, -1.0]), fj), None)
+                    return ((grad_obj, fj), None)
             else:
                 raise ValueError("Unexpected index value")
 
-        return ((np.array([-1.0, -1.0]), 0.0), f0)
+        return ((grad_obj, 0.0), f0)
 
 
 def test_case_feasible():
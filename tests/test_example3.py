@@ -7,7 +7,7 @@ from __future__ import print_function
 import numpy as np
 from ellalgo.cutting_plane import BSearchAdaptor, Options, bsearch
 from ellalgo.ell import Ell
-from ellalgo.ell_typing import OracleFeas2
+from ellalgo.ell_typing import OracleBS, OracleFeas2, SearchSpace2
 
 num_constraints = 4
 
@@ -81,3 +81,73 @@ def test_case_feasible():
     xbest, num_iters = bsearch(adaptor, (-100.0, 100.0), options)
     assert xbest is not None
     assert num_iters == 34
+
+
+class MyEll(SearchSpace2):
+    """
+    A search space without its own `clone`, so `BSearchAdaptor` falls back to the default deep copy.
+    """
+
+    def __init__(self, val, xinit):
+        self.ell = Ell(val, xinit)
+
+    def update_bias_cut(self, cut):
+        return self.ell.update_bias_cut(cut)
+
+    def update_central_cut(self, cut):
+        return self.ell.update_central_cut(cut)
+
+    def xc(self):
+        return self.ell.xc()
+
+    def set_xc(self, xc):
+        self.ell.set_xc(xc)
+
+    def tsq(self):
+        return self.ell.tsq()
+
+
+def test_case_default_clone():
+    """
+    The function `test_case_default_clone` checks that a search space relying on the default `clone`
+    behaves like `Ell` in the binary search.
+    """
+    xinit = np.array([0.0, 0.0])  # initial xinit
+    ellip = MyEll(100.0, xinit)
+    options = Options()
+    options.tolerance = 1e-8
+    adaptor = BSearchAdaptor(MyOracle3(), ellip, options)
+    xbest, num_iters = bsearch(adaptor, (-100.0, 100.0), options)
+    assert xbest is not None
+    assert num_iters == 34
+
+
+class MyOracleSign(OracleBS):
+    """
+    The `MyOracleSign` class is feasible exactly for non-negative `gamma`.
+    """
+
+    def assess_bs(self, gamma):
+        return gamma >= 0.0
+
+
+def test_case_huge_interval():
+    """
+    The function `test_case_huge_interval` checks that `bsearch` does not overflow when the width of
+    the interval exceeds the largest float.
+    """
+    options = Options()
+    options.tolerance = 1e-8
+    upper, num_iters = bsearch(MyOracleSign(), (-1e308, 1e308), options)
+    assert 0.0 <= upper < 1e-8
+    assert num_iters < options.max_iters
+
+    intrvl = (np.float64(-1e308), np.float64(1e308))
+    upper, num_iters = bsearch(MyOracleSign(), intrvl, options)
+    assert 0.0 <= upper < 1e-8
+    assert num_iters < options.max_iters
+
+    intrvl32 = (np.float32(-3e38), np.float32(3e38))
+    upper, num_iters = bsearch(MyOracleSign(), intrvl32, options)
+    assert 0.0 <= upper < 1e-8
+    assert num_iters < options.max_iters
@@ -20,6 +20,12 @@ class MyQuasicvxOracle(OracleOptim):
 
     idx = -1  # for round robin
 
+    def __init__(self):
+        """
+        The function preallocates the gradient buffer returned by `assess_optim`.
+        """
+        self._g = np.empty(2)
+
     def assess_optim(self, xc, gamma: float):
         """
         This Python function assesses the optimality of a given point based on constraints and an objective
@@ -36,6 +42,7 @@ class MyQuasicvxOracle(OracleOptim):
             either `None` or the value of the updated `gamma` parameter.
         """
         x, y = xc
+        g = self._g  # reused on every call; the ellipsoid does not keep it
 
         for _ in range(3):
             self.idx += 1
@@ -46,7 +53,8 @@ class MyQuasicvxOracle(OracleOptim):
                 # constraint 1: exp(x) <= y
                 tmp = math.exp(x)
                 if (fj := tmp - y) > 0.0:
-                    return (np.array([tmp, -1.0]), fj), None
+                    g[0], g[1] = tmp, -1.0
+                    return (g, fj), None
             elif self.idx == 1:
                 # constraint 2: y > 0
                 if y <= 0.0:
@@ -58,11 +66,14 @@ class MyQuasicvxOracle(OracleOptim):
 
         # objective: maximize sqrt(x) / y
         tmp2 = math.sqrt(x)
+        g[0] = -0.5 / tmp2
         if (fj := -tmp2 + gamma * y) > 0.0:  # infeasible
-            return (np.array([-0.5 / tmp2, gamma]), fj), None
+            g[1] = gamma
+            return (g, fj), None
 
         gamma = tmp2 / y
-        return (np.array([-0.5 / tmp2, gamma]), 0.0), gamma
+        g[1] = gamma
+        return (g, 0.0), gamma
 
 
 def test_case_feasible():